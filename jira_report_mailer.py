@@ -17,22 +17,39 @@ Features:
 """
 
 import os
+import re
 import sys
 import logging
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from pathlib import Path
+import atexit
 import base64
+import functools
+import hashlib
+import importlib.util
 import io
+import stat
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from PIL import Image
+
+try:
+    import orjson  # Optional: faster decoding of large JIRA pages
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    # Only the opt-in parallel screenshot capture needs asyncio at runtime
+    import asyncio
 
 # Configure logging
 logging.basicConfig(
@@ -41,6 +58,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Loose sanity check for configured addresses: one '@' and a dotted domain
+EMAIL_ADDRESS_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
 
 class ConfigurationError(Exception):
     """Raised when required configuration is missing or invalid."""
@@ -61,7 +81,10 @@ class JIRAConfig:
     ]
 
     def __init__(self):
-        load_dotenv()
+        # Deployments that set real environment variables skip dotenv's file I/O
+        env_file = Path(__file__).with_name('.env')
+        if env_file.exists():
+            load_dotenv(env_file, override=False)
         self._validate_config()
         self._load_config()
 
@@ -85,32 +108,60 @@ class JIRAConfig:
         self.sprint_name = os.getenv('SPRINT_NAME')
 
         # Optional email configuration
-        self.email_recipients = os.getenv('EMAIL_RECIPIENTS', '').split(',')
-        self.email_recipients = [r.strip() for r in self.email_recipients if r.strip()]
+        self.email_recipients = self._csv_env('EMAIL_RECIPIENTS')
+        self.email_cc_recipients = self._csv_env('EMAIL_CC_RECIPIENTS')
 
-        self.email_cc_recipients = os.getenv('EMAIL_CC_RECIPIENTS', '').split(',')
-        self.email_cc_recipients = [r.strip() for r in self.email_cc_recipients if r.strip()]
+        for address in self.email_recipients + self.email_cc_recipients:
+            if not EMAIL_ADDRESS_PATTERN.fullmatch(address):
+                logger.warning(f"Email address looks invalid: {address}")
 
         # SMTP configuration (optional)
         self.smtp_server = os.getenv('SMTP_SERVER')
-        self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
+        self.smtp_port = int(os.getenv('SMTP_PORT', '465'))
+        # Implicit TLS unless told otherwise; 587 and 25 are STARTTLS ports
+        smtp_use_ssl = os.getenv('SMTP_USE_SSL')
+        if smtp_use_ssl:
+            self.smtp_use_ssl = smtp_use_ssl.lower() in ('1', 'true', 'yes')
+        else:
+            self.smtp_use_ssl = self.smtp_port not in (25, 587)
         self.email_user = os.getenv('EMAIL_USER')
         self.email_password = os.getenv('EMAIL_PASSWORD')
 
         # Issue type configuration
-        self.story_types = os.getenv('STORY_TYPES', 'Story').split(',')
-        self.defect_types = os.getenv('DEFECT_TYPES', 'Escaped Defect,Bug,Defect').split(',')
-        self.story_types = [t.strip() for t in self.story_types]
-        self.defect_types = [t.strip() for t in self.defect_types]
+        self.story_types = self._csv_env('STORY_TYPES', 'Story')
+        self.defect_types = self._csv_env('DEFECT_TYPES', 'Escaped Defect,Bug,Defect')
+
+        # API configuration
+        self.page_size = int(os.getenv('JIRA_PAGE_SIZE', '100'))
+        self.cache_ttl_minutes = int(os.getenv('JIRA_CACHE_TTL_MINUTES', '0'))
+        self.issue_fields = os.getenv('JIRA_ISSUE_FIELDS')
 
         # Screenshot configuration
         self.screenshot_width = int(os.getenv('SCREENSHOT_WIDTH', '1400'))
+        self.screenshot_parallel = os.getenv('SCREENSHOT_PARALLEL', 'false').lower() in ('1', 'true', 'yes')
         self.email_image_max_width = int(os.getenv('EMAIL_IMAGE_MAX_WIDTH', '1000'))
 
+    @staticmethod
+    def _csv_env(name: str, default: str = '') -> List[str]:
+        """Read a comma-separated environment variable as a list of trimmed, non-empty values."""
+        return [value.strip() for value in os.getenv(name, default).split(',') if value.strip()]
+
 
 class JIRAClient:
     """Handles JIRA Agile API interactions."""
 
+    # Concurrent page requests after the first page has reported the total
+    MAX_WORKERS = 8
+
+    # Pooled keep-alive connections per host
+    POOL_SIZE = 16
+
+    # Issue fields requested from JIRA by default; everything else is left out
+    ISSUE_FIELDS = 'key,summary,status,assignee,updated,issuetype,priority,created,reporter'
+
+    # Private per-user directory for the opt-in parsed-issue cache
+    CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'jira-sprint-reporter'
+
     def __init__(self, config: JIRAConfig):
         self.config = config
         self.session = requests.Session()
@@ -119,70 +170,232 @@ class JIRAClient:
             'Authorization': self._construct_auth_header()
         })
 
+        # Keep-alive pool large enough for every worker, with backoff on
+        # rate limiting (429) and transient server errors
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=retries
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def _construct_auth_header(self) -> str:
         """Construct Basic Auth header from credentials."""
         credentials = f"{self.config.username}:{self.config.api_token}"
         encoded = base64.b64encode(credentials.encode('utf-8')).decode('utf-8')
         return f"Basic {encoded}"
 
-    def fetch_sprint_issues(self, max_results: int = 50) -> List[Dict]:
+    def fetch_sprint_dataframe(self, cache_ttl: timedelta = timedelta(0),
+                               fields: Optional[str] = None) -> pd.DataFrame:
+        """
+        Fetch and parse the sprint issues, optionally reusing a recent on-disk copy.
+
+        With a non-zero cache_ttl the parsed DataFrame is cached as Parquet
+        in a private per-user directory (CACHE_DIR), keyed by JIRA instance,
+        sprint, day and requested fields. Re-runs within cache_ttl (e.g.
+        while tweaking the report or re-capturing screenshots) skip the JIRA
+        fetch and parse entirely. Cache files not owned by the current user
+        are ignored. Caching needs pyarrow and is skipped silently without it.
+
+        Args:
+            cache_ttl: Maximum age of a reusable cache file; zero (the default) disables caching
+            fields: Comma-separated JIRA fields to request (defaults to ISSUE_FIELDS)
+
+        Returns:
+            DataFrame with parsed issue data
+        """
+        fields = fields or self.ISSUE_FIELDS
+        cache_path = self._cache_path(fields)
+
+        if cache_ttl and self._is_own_file(cache_path):
+            age = time.time() - cache_path.stat().st_mtime
+            if age < cache_ttl.total_seconds():
+                try:
+                    df = pd.read_parquet(cache_path)
+                    logger.info(f"Loaded {len(df)} issues from cache: {cache_path}")
+                    return df
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+
+        sprint_issues = self.fetch_sprint_issues(fields=fields)
+
+        logger.info("Parsing issues...")
+        df = IssueParser.parse_issues(sprint_issues)
+
+        if cache_ttl and not df.empty:
+            try:
+                self.CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                self.CACHE_DIR.chmod(0o700)
+                df.to_parquet(cache_path, compression='zstd')
+                cache_path.chmod(0o600)
+                logger.info(f"Cached parsed issues: {cache_path}")
+            except Exception as e:
+                logger.debug(f"Skipping issue cache: {e}")
+
+        return df
+
+    def _cache_path(self, fields: str) -> Path:
+        """Cache file location for today's parsed sprint issues."""
+        key = '|'.join([
+            self.config.base_url,
+            self.config.sprint_id,
+            datetime.now().strftime('%Y-%m-%d'),
+            fields
+        ])
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return self.CACHE_DIR / f"jira_sprint_{self.config.sprint_id}_{digest}.parquet"
+
+    @staticmethod
+    def _is_own_file(path: Path) -> bool:
+        """Whether path is an existing regular file owned by the current user."""
+        try:
+            st = path.lstat()
+        except OSError:
+            return False
+
+        if not stat.S_ISREG(st.st_mode):
+            return False
+
+        # No uid on Windows, where the cache lives in the private profile directory
+        if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+            logger.warning(f"Ignoring cache {path}: not owned by the current user")
+            return False
+
+        return True
+
+    def fetch_sprint_issues(self, max_results: Optional[int] = None,
+                            fields: Optional[str] = None) -> List[Dict]:
         """
         Fetch all issues from the sprint using Agile API.
         Uses the /rest/agile/1.0/sprint/{sprintId}/issue endpoint.
 
+        The first page is fetched on its own to learn the total; the
+        remaining pages are then requested concurrently and merged in
+        offset order. The reported total is authoritative: if the server
+        caps the page size below the requested one, the number of issues it
+        actually returned is used for the remaining pages, and any page that
+        still comes back short is topped up from where it stopped.
+
         Args:
-            max_results: Number of results per page
+            max_results: Number of results per page (defaults to JIRA_PAGE_SIZE)
+            fields: Comma-separated JIRA fields to request (defaults to ISSUE_FIELDS)
 
         Returns:
             List of issue dictionaries
         """
+        max_results = max_results or self.config.page_size
+        fields = fields or self.ISSUE_FIELDS
         api_url = f"{self.config.base_url}/rest/agile/1.0/sprint/{self.config.sprint_id}/issue"
 
-        all_issues = []
-        start_at = 0
-
         logger.info(f"Fetching sprint issues from: {api_url}")
 
-        while True:
-            params = {
-                'startAt': start_at,
-                'maxResults': max_results,
-                'fields': 'key,summary,status,assignee,updated,issuetype,priority,created,reporter'
-            }
+        data = self._fetch_page(api_url, 0, max_results, fields)
 
-            try:
-                response = self.session.get(api_url, params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-                with open("response.json", 'w') as f:
-                    f.write(str(data))
-                issues = data.get('issues', [])
-                all_issues.extend(issues)
-
-                total = data.get('total', 0)
-                logger.info(f"Fetched {len(all_issues)}/{total} issues")
+        all_issues = data.get('issues', [])
+        total = data.get('total', 0)
+        logger.info(f"Fetched {len(all_issues)}/{total} issues")
 
-                if len(issues) < max_results:
-                    break
+        page_size = data.get('maxResults') or max_results
+        if all_issues and len(all_issues) < min(page_size, total):
+            # Step by what the server actually returned, not what it claims
+            page_size = len(all_issues)
+        if page_size < max_results and len(all_issues) < total:
+            logger.warning(f"JIRA capped page size at {page_size} (requested {max_results})")
 
-                start_at += max_results
+        offsets = range(len(all_issues), total, page_size) if all_issues else range(0)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(offsets))) as executor:
+                pages = executor.map(lambda start_at: self._fetch_page(api_url, start_at, page_size, fields), offsets)
+                for start_at, page in zip(offsets, pages):
+                    expected = min(page_size, total - start_at)
+                    all_issues.extend(self._complete_page(api_url, start_at, page, expected, fields))
+                    logger.info(f"Fetched {len(all_issues)}/{total} issues")
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error fetching issues: {e}")
-                raise
+        if len(all_issues) < total:
+            logger.warning(f"JIRA reported {total} issues but only {len(all_issues)} were returned")
 
         logger.info(f"Total sprint issues fetched: {len(all_issues)}")
         return all_issues
 
+    def _complete_page(self, api_url: str, start_at: int, page: Dict, expected: int, fields: str) -> List[Dict]:
+        """Re-request the tail of a page that came back with fewer issues than expected."""
+        issues = page.get('issues', [])
+
+        while len(issues) < expected:
+            logger.warning(f"Page at {start_at} truncated ({len(issues)}/{expected}), fetching the rest")
+            remaining = self._fetch_page(api_url, start_at + len(issues), expected - len(issues), fields)
+            more = remaining.get('issues', [])
+            if not more:
+                # The sprint shrank between requests; nothing more to fetch
+                break
+            issues.extend(more)
+
+        return issues
+
+    def _fetch_page(self, api_url: str, start_at: int, max_results: int, fields: str) -> Dict:
+        """Fetch a single page of sprint issues."""
+        params = {
+            'startAt': start_at,
+            'maxResults': max_results,
+            'fields': fields,
+            # No changelog, renderedFields, etc.
+            'expand': ''
+        }
+
+        try:
+            response = self.session.get(api_url, params=params, timeout=30)
+            response.raise_for_status()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                Path(f"response_{start_at}.json").write_bytes(response.content)
+
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching issues: {e}")
+            raise
+
 
 class IssueParser:
     """Parses JIRA issues into structured DataFrames."""
 
+    # Flattened JIRA field -> (report column, value used when missing)
+    FIELD_COLUMNS = {
+        'key': ('Task ID', ''),
+        'fields.summary': ('Task Name', ''),
+        'fields.status.name': ('Status', 'Unknown'),
+        'fields.assignee.displayName': ('Assigned To', 'Unassigned'),
+        'fields.reporter.displayName': ('Reporter', 'Unknown'),
+        'fields.issuetype.name': ('Issue Type', 'Unknown'),
+        'fields.priority.name': ('Priority', 'None'),
+    }
+
+    # Columns stored as pandas categoricals
+    CATEGORY_COLUMNS = ('Status', 'Assigned To', 'Reporter', 'Issue Type', 'Priority')
+
+    # Flattened JIRA date field -> report column
+    DATE_COLUMNS = {
+        'fields.created': 'Created',
+        'fields.updated': 'Last Updated',
+    }
+
     @staticmethod
     def parse_issues(issues: List[Dict]) -> pd.DataFrame:
         """
         Parse JIRA issues into a pandas DataFrame.
 
+        The issues are flattened in one pd.json_normalize pass and every
+        column is filled and converted with vectorized operations rather
+        than row by row.
+
         Args:
             issues: List of issue dictionaries from JIRA API
 
@@ -193,61 +406,406 @@ class IssueParser:
             logger.warning("No issues to parse")
             return pd.DataFrame()
 
-        data = []
-        for issue in issues:
-            try:
-                fields = issue.get('fields', {})
+        flat = pd.json_normalize(issues, sep='.')
 
-                assignee = fields.get('assignee')
-                assignee_name = assignee.get('displayName') if assignee else 'Unassigned'
+        columns = {}
+        for field, (column, default) in IssueParser.FIELD_COLUMNS.items():
+            if field in flat.columns:
+                columns[column] = flat[field].fillna(default)
+            else:
+                columns[column] = pd.Series(default, index=flat.index)
 
-                reporter = fields.get('reporter')
-                reporter_name = reporter.get('displayName') if reporter else 'Unknown'
+        for field, column in IssueParser.DATE_COLUMNS.items():
+            if field in flat.columns:
+                # Kept as YYYY-MM-DD strings: that's all the report displays,
+                # and ISO dates sort correctly as text
+                columns[column] = flat[field].fillna('').astype(str).str[:10]
+            else:
+                columns[column] = pd.Series('', index=flat.index)
 
-                status = fields.get('status', {})
-                status_name = status.get('name', 'Unknown')
+        df = pd.DataFrame(columns)
 
-                issuetype = fields.get('issuetype', {})
-                issue_type_name = issuetype.get('name', 'Unknown')
+        # Low-cardinality text columns: int codes instead of Python strings
+        for column in IssueParser.CATEGORY_COLUMNS:
+            df[column] = df[column].astype('category')
 
-                priority = fields.get('priority', {})
-                priority_name = priority.get('name', 'None') if priority else 'None'
+        if not df.empty and 'Last Updated' in df.columns:
+            df = df.sort_values('Last Updated', ascending=False, kind='mergesort')
 
-                updated_str = fields.get('updated', '')
-                created_str = fields.get('created', '')
+        return df
 
-                updated_date = datetime.strptime(updated_str[:10], '%Y-%m-%d') if updated_str else None
-                created_date = datetime.strptime(created_str[:10], '%Y-%m-%d') if created_str else None
 
-                data.append({
-                    'Task ID': issue.get('key', ''),
-                    'Task Name': fields.get('summary', ''),
-                    'Status': status_name,
-                    'Assigned To': assignee_name,
-                    'Reporter': reporter_name,
-                    'Issue Type': issue_type_name,
-                    'Priority': priority_name,
-                    'Created': created_date,
-                    'Last Updated': updated_date
-                })
+# Status classification used by the summary cards
+DONE_STATUS_PATTERN = re.compile('Done|Closed|Resolved', re.IGNORECASE)
+IN_PROGRESS_STATUS_PATTERN = re.compile('In Progress|Development', re.IGNORECASE)
 
-            except Exception as e:
-                logger.warning(f"Error parsing issue {issue.get('key', 'unknown')}: {e}")
-                continue
+# Status name -> 'done' / 'in_progress' / 'todo', filled in as statuses are seen
+_status_buckets: Dict[str, str] = {}
 
-        df = pd.DataFrame(data)
 
-        if not df.empty and 'Last Updated' in df.columns:
-            df = df.sort_values('Last Updated', ascending=False)
+def status_buckets(statuses: pd.Series) -> pd.Series:
+    """
+    Classify a Status column into 'done', 'in_progress' or 'todo'.
 
-        return df
+    The regexes run once per distinct status name (typically fewer than
+    ten) and the result is mapped back onto the column in one pass.
+    """
+    for status in statuses.dropna().unique():
+        if status not in _status_buckets:
+            if DONE_STATUS_PATTERN.search(status):
+                _status_buckets[status] = 'done'
+            elif IN_PROGRESS_STATUS_PATTERN.search(status):
+                _status_buckets[status] = 'in_progress'
+            else:
+                _status_buckets[status] = 'todo'
+    return statuses.map(_status_buckets).astype(object).fillna('todo')
+
+
+STATUS_COLORS = {
+    'Done': '#28a745',
+    'Closed': '#20c997',
+    'Resolved': '#17a2b8',
+    'In Progress': '#ffc107',
+    'Development': '#fd7e14',
+    'To Do': '#6c757d',
+    'Open': '#dc3545',
+    'Reopened': '#e83e8c',
+    'FORMAL TEST': '#007bff',
+    'INFORMAL TEST': '#6610f2'
+}
+
+
+@functools.lru_cache(maxsize=256)
+def status_color(status: str) -> str:
+    """
+    Chart colour for a status.
+
+    Unknown statuses get a colour derived from an MD5 of the name, which
+    (unlike hash()) is stable across runs, so the same sprint always
+    renders identical charts and screenshots.
+    """
+    return STATUS_COLORS.get(status) or '#' + hashlib.md5(status.encode('utf-8')).hexdigest()[:6]
+
+
+def _memoize_chart(column: str):
+    """
+    Cache a chart builder's HTML keyed by the data it actually plots.
+
+    The key is the builder name, the values of `column` in the order they
+    first appear (the assignee chart draws its bars in that order), their
+    counts and any extra arguments, so re-rendering the same sprint returns
+    the cached Plotly HTML instead of rebuilding and re-serializing the
+    figure. Entries are evicted least-recently-used.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, df: pd.DataFrame, *args) -> str:
+            if df.empty:
+                return method(self, df, *args)
+
+            values = df[column]
+            counts = values.value_counts(sort=False)
+            plotted = tuple((value, counts[value]) for value in values.unique())
+            key = (method.__name__, plotted, args)
+
+            cached = self._chart_cache.get(key)
+            if cached is not None:
+                self._chart_cache.move_to_end(key)
+                return cached
+
+            chart_html = method(self, df, *args)
+            self._chart_cache[key] = chart_html
+            if len(self._chart_cache) > self.CHART_CACHE_SIZE:
+                self._chart_cache.popitem(last=False)
+            return chart_html
+
+        return wrapper
+
+    return decorator
+
+
+# Static pieces of the HTML report. The stylesheet is kept out of the
+# format templates so it is written verbatim rather than re-interpolated
+_REPORT_HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Sprint Report - {sprint_name}</title>
+
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
+    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.6/css/dataTables.bootstrap5.min.css">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+
+    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js" charset="utf-8"></script>
+    <script src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
+    <script src="https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js"></script>
+    <script src="https://cdn.datatables.net/1.13.6/js/dataTables.bootstrap5.min.js"></script>
+
+    <style>
+"""
+
+_REPORT_CSS = """        :root {
+            --primary-color: #0066cc;
+            --secondary-color: #6c757d;
+            --success-color: #28a745;
+            --warning-color: #ffc107;
+            --danger-color: #dc3545;
+            --light-bg: #f8f9fa;
+            --dark-text: #212529;
+        }
+
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: var(--dark-text);
+            line-height: 1.6;
+            padding: 20px;
+        }
+
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 10px 40px rgba(0, 0, 0, 0.2);
+            overflow: hidden;
+        }
+
+        .header {
+            background: linear-gradient(135deg, var(--primary-color) 0%, #004999 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+
+        .header h1 {
+            font-size: 2.5rem;
+            margin-bottom: 10px;
+            font-weight: 700;
+        }
+
+        .header .meta-info {
+            font-size: 1rem;
+            opacity: 0.9;
+        }
+
+        .content {
+            padding: 40px;
+        }
+
+        .summary-cards {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin-bottom: 40px;
+        }
+
+        .summary-card {
+            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+            border-radius: 12px;
+            padding: 25px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            transition: transform 0.3s ease, box-shadow 0.3s ease;
+        }
+
+        .summary-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 8px 15px rgba(0, 0, 0, 0.2);
+        }
+
+        .summary-card h3 {
+            font-size: 1rem;
+            color: var(--secondary-color);
+            margin-bottom: 15px;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+
+        .big-number {
+            font-size: 3rem;
+            font-weight: 700;
+            color: var(--primary-color);
+            margin-bottom: 15px;
+        }
+
+        .progress-bar {
+            height: 8px;
+            background: #e9ecef;
+            border-radius: 4px;
+            overflow: hidden;
+            margin-bottom: 10px;
+        }
+
+        .progress-fill {
+            height: 100%;
+            background: linear-gradient(90deg, var(--success-color) 0%, #20c997 100%);
+            transition: width 1s ease;
+        }
+
+        .progress-fill.defect {
+            background: linear-gradient(90deg, var(--warning-color) 0%, #fd7e14 100%);
+        }
+
+        .stat-detail {
+            font-size: 0.9rem;
+            color: var(--secondary-color);
+        }
+
+        .chart-section {
+            margin-bottom: 50px;
+        }
+
+        .chart-section h2 {
+            font-size: 1.8rem;
+            margin-bottom: 25px;
+            color: var(--dark-text);
+            border-bottom: 3px solid var(--primary-color);
+            padding-bottom: 10px;
+        }
+
+        .charts-row {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
+            gap: 30px;
+            margin-bottom: 30px;
+        }
+
+        .chart-container {
+            background: white;
+            border-radius: 8px;
+            padding: 20px;
+            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
+        }
+
+        .chart-container.full-width {
+            grid-column: 1 / -1;
+        }
+
+        .table-section {
+            margin-bottom: 50px;
+        }
+
+        .table-section h2 {
+            font-size: 1.8rem;
+            margin-bottom: 20px;
+            color: var(--dark-text);
+            border-bottom: 3px solid var(--primary-color);
+            padding-bottom: 10px;
+        }
+
+        .data-table {
+            width: 100% !important;
+            font-size: 0.9rem;
+        }
+
+        .data-table thead th {
+            background: var(--primary-color);
+            color: white;
+            font-weight: 600;
+            text-transform: uppercase;
+            font-size: 0.85rem;
+            letter-spacing: 0.5px;
+            padding: 12px 8px;
+        }
+
+        .data-table tbody td {
+            padding: 10px 8px;
+            vertical-align: middle;
+        }
+
+        .data-table tbody tr:hover {
+            background-color: #f1f3f5;
+        }
+
+        .footer {
+            background: #2c3e50;
+            color: white;
+            text-align: center;
+            padding: 25px;
+            font-size: 0.9rem;
+        }
+
+        @media (max-width: 768px) {
+            .header h1 {
+                font-size: 2rem;
+            }
+
+            .charts-row {
+                grid-template-columns: 1fr;
+            }
+
+            .summary-cards {
+                grid-template-columns: 1fr;
+            }
+        }
+"""
+
+_REPORT_HTML_BANNER = """    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header" id="header-section">
+            <h1><i class="fas fa-chart-line"></i> Sprint Report</h1>
+            <div class="meta-info">
+                <strong>{sprint_name}</strong>
+
+                Generated on {generated}
+            </div>
+        </div>
+
+        <div class="content">
+            """
+
+_REPORT_HTML_SEPARATOR = """
+            """
+
+_REPORT_HTML_EMPTY = """<p>No stories or defects found in this sprint.</p>"""
+
+_REPORT_HTML_TAIL = """
+        </div>
+
+        <div class="footer">
+            <p><i class="fas fa-code"></i> Auto-generated Sprint Report | JIRA Agile API Integration</p>
+            <p>&copy; {year} - Powered by Python & Plotly</p>
+        </div>
+    </div>
+
+    <script>
+        $(document).ready(function() {{
+            $('.data-table').DataTable({{
+                pageLength: 25,
+                order: [[8, 'desc']],
+                responsive: true,
+                language: {{
+                    search: "Filter records:",
+                    lengthMenu: "Show _MENU_ entries per page",
+                    info: "Showing _START_ to _END_ of _TOTAL_ entries"
+                }}
+            }});
+        }});
+    </script>
+</body>
+</html>
+"""
 
 
 class ReportGenerator:
     """Generates HTML reports with interactive visualizations."""
 
+    # Rendered chart HTML kept for repeated report generation
+    CHART_CACHE_SIZE = 32
+
     def __init__(self, config: JIRAConfig):
         self.config = config
+        self._chart_cache: OrderedDict = OrderedDict()
 
     def generate_html_report(
             self,
@@ -268,25 +826,35 @@ class ReportGenerator:
         """
         logger.info(f"Generating HTML report: {output_file}")
 
-        # Create visualizations
-        charts_html = self._generate_charts(story_df, defect_df)
-
-        # Generate summary statistics
-        summary_html = self._generate_summary_stats(story_df, defect_df)
+        now = datetime.now()
+
+        # Stream each section to the file as it is generated rather than
+        # assembling the whole document in memory first
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(_REPORT_HTML_HEAD.format(sprint_name=self.config.sprint_name))
+            f.write(_REPORT_CSS)
+            f.write(_REPORT_HTML_BANNER.format(
+                sprint_name=self.config.sprint_name,
+                generated=now.strftime('%B %d, %Y at %I:%M %p')
+            ))
+
+            if story_df.empty and defect_df.empty:
+                # Nothing to summarize, chart or tabulate
+                logger.warning("No stories or defects to report")
+                f.write(_REPORT_HTML_EMPTY)
+            else:
+                # Summary statistics
+                f.write(self._generate_summary_stats(story_df, defect_df))
+                f.write(_REPORT_HTML_SEPARATOR)
 
-        # Generate tables
-        tables_html = self._generate_tables(story_df, defect_df)
+                # Visualizations
+                f.write(self._generate_charts(story_df, defect_df))
+                f.write(_REPORT_HTML_SEPARATOR)
 
-        # Combine into full HTML report
-        html_content = self._create_html_template(
-            summary_html,
-            charts_html,
-            tables_html
-        )
+                # Tables
+                f.write(self._generate_tables(story_df, defect_df))
 
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(_REPORT_HTML_TAIL.format(year=now.year))
 
         logger.info(f"HTML report generated successfully: {output_file}")
         return output_file
@@ -300,15 +868,14 @@ class ReportGenerator:
         total_stories = len(story_df)
         total_defects = len(defect_df)
 
-        stories_done = len(story_df[story_df['Status'].str.contains('Done|Closed|Resolved', case=False,
-                                                                    na=False)]) if not story_df.empty else 0
-        stories_in_progress = len(story_df[story_df['Status'].str.contains('In Progress|Development', case=False,
-                                                                           na=False)]) if not story_df.empty else 0
+        story_buckets = status_buckets(story_df['Status']) if not story_df.empty else pd.Series(dtype=object)
+        stories_done = int((story_buckets == 'done').sum())
+        stories_in_progress = int((story_buckets == 'in_progress').sum())
         stories_todo = total_stories - stories_done - stories_in_progress
 
-        defects_open = len(defect_df[~defect_df['Status'].str.contains('Done|Closed|Resolved', case=False,
-                                                                       na=False)]) if not defect_df.empty else 0
-        defects_closed = total_defects - defects_open
+        defect_buckets = status_buckets(defect_df['Status']) if not defect_df.empty else pd.Series(dtype=object)
+        defects_closed = int((defect_buckets == 'done').sum())
+        defects_open = total_defects - defects_closed
 
         story_completion = (stories_done / total_stories * 100) if total_stories > 0 else 0
         defect_resolution = (defects_closed / total_defects * 100) if total_defects > 0 else 0
@@ -400,55 +967,31 @@ class ReportGenerator:
 
         return charts_html
 
+    @_memoize_chart('Status')
     def _create_status_chart(self, df: pd.DataFrame, title: str) -> str:
         """Create status distribution chart."""
         if df.empty:
             return "<p>No data available</p>"
 
-        # Get status counts
+        # Get status counts (categoricals also report statuses absent from this subset)
         status_counts = df['Status'].value_counts()
+        status_counts = status_counts[status_counts > 0]
 
-        # === COMPREHENSIVE DEBUGGING ===
-        print(f"\n{'=' * 60}")
-        print(f"DEBUG: Creating {title} Chart")
-        print(f"{'=' * 60}")
-        print(f"Total rows in DataFrame: {len(df)}")
-        print(f"Unique statuses: {df['Status'].nunique()}")
-        print(f"\nStatus breakdown:")
-        for status, count in status_counts.items():
-            percentage = (count / status_counts.sum()) * 100
-            print(f"  {status:20s}: {count:3d} ({percentage:5.1f}%)")
-        print(f"\nTotal: {status_counts.sum()}")
-
-        # Verify the data types
-        print(f"\nData types:")
-        print(f"  status_counts.index type: {type(status_counts.index)}")
-        print(f"  status_counts.values type: {type(status_counts.values)}")
-        print(f"  First value type: {type(status_counts.values[0])}")
-
-        # Check for any NaN or infinite values
-        if status_counts.isna().any():
-            print("WARNING: NaN values detected in counts!")
-        if (status_counts == 0).any():
-            print("WARNING: Zero values detected in counts!")
-
-        print(f"{'=' * 60}\n")
-        # === END DEBUGGING ===
-
-        color_map = {
-            'Done': '#28a745',
-            'Closed': '#20c997',
-            'Resolved': '#17a2b8',
-            'In Progress': '#ffc107',
-            'Development': '#fd7e14',
-            'To Do': '#6c757d',
-            'Open': '#dc3545',
-            'Reopened': '#e83e8c',
-            'FORMAL TEST': '#007bff',
-            'INFORMAL TEST': '#6610f2'
-        }
+        if logger.isEnabledFor(logging.DEBUG):
+            total = status_counts.sum()
+            logger.debug("Creating %s chart: %d rows, %d unique statuses", title, len(df), len(status_counts))
+            for status, count in status_counts.items():
+                logger.debug("  %-20s: %3d (%5.1f%%)", status, count, count / total * 100)
+            logger.debug("Total: %d", total)
 
-        colors = [color_map.get(status, f'#{hash(status) % 0xFFFFFF:06x}') for status in status_counts.index]
+            if status_counts.isna().any():
+                logger.debug("NaN values detected in %s status counts", title)
+            if (status_counts == 0).any():
+                logger.debug("Zero values detected in %s status counts", title)
+
+        colors = [status_color(status) for status in status_counts.index]
+
+        import plotly.graph_objects as go
 
         fig = go.Figure(data=[go.Pie(
             labels=status_counts.index.tolist(),  # Convert to list explicitly
@@ -472,6 +1015,7 @@ class ReportGenerator:
 
         return fig.to_html(full_html=False, include_plotlyjs=False)
 
+    @_memoize_chart('Assigned To')
     def _create_assignee_chart(self, df: pd.DataFrame, title: str) -> str:
         """Create assignee distribution chart."""
         if df.empty:
@@ -490,6 +1034,8 @@ class ReportGenerator:
         assignee_names = list(assignee_counts.index)
         assignee_values = list(assignee_counts.values)
 
+        import plotly.graph_objects as go
+
         # Create bar chart with explicit horizontal orientation
         fig = go.Figure(data=[go.Bar(
             x=assignee_values,  # Number of tasks go on the x-axis
@@ -517,6 +1063,7 @@ class ReportGenerator:
         # Return the figure as HTML
         return fig.to_html(full_html=False, include_plotlyjs=False)
 
+    @_memoize_chart('Priority')
     def _create_priority_chart(self, df: pd.DataFrame) -> str:
         """Create priority distribution chart for defects."""
         if df.empty:
@@ -539,6 +1086,8 @@ class ReportGenerator:
         # Map colors to priorities
         colors = [priority_colors.get(p, '#007bff') for p in priority_counts.index]
 
+        import plotly.graph_objects as go
+
         # Create bar chart with explicit vertical orientation
         fig = go.Figure(data=[go.Bar(
             x=priority_counts.index,  # Categories (priorities) go on the x-axis
@@ -565,356 +1114,254 @@ class ReportGenerator:
 
     def _generate_tables(self, story_df: pd.DataFrame, defect_df: pd.DataFrame) -> str:
         """Generate interactive tables."""
-        tables_html = ""
+        if story_df.empty and defect_df.empty:
+            return ""
 
-        date_columns = ['Created', 'Last Updated']
+        tables = (
+            (story_df, 'stories-table-section', 'stories_table', '📝 Stories'),
+            (defect_df, 'defects-table-section', 'defects_table', '🐛 Defects'),
+        )
 
-        if not story_df.empty:
-            story_display = story_df.copy()
-            for col in date_columns:
-                if col in story_display.columns:
-                    story_display[col] = story_display[col].dt.strftime('%Y-%m-%d')
-
-            tables_html += f"""
-            <div class="table-section" id="stories-table-section">
-                <h2>📝 Stories ({len(story_df)} total)</h2>
-                <table id="stories_table" class="display data-table">
-                    <thead>
-                        <tr>
-                            {''.join(f'<th>{col}</th>' for col in story_display.columns)}
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {''.join(
-                '<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>'
-                for _, row in story_display.iterrows()
-            )}
-                    </tbody>
-                </table>
-            </div>
-            """
+        # Each table is written straight into one buffer instead of being
+        # built as a string and concatenated
+        buf = io.StringIO()
+        for df, section_id, table_id, heading in tables:
+            if df.empty:
+                continue
 
-        if not defect_df.empty:
-            defect_display = defect_df.copy()
-            for col in date_columns:
-                if col in defect_display.columns:
-                    defect_display[col] = defect_display[col].dt.strftime('%Y-%m-%d')
-
-            tables_html += f"""
-            <div class="table-section" id="defects-table-section">
-                <h2>🐛 Defects ({len(defect_df)} total)</h2>
-                <table id="defects_table" class="display data-table">
-                    <thead>
-                        <tr>
-                            {''.join(f'<th>{col}</th>' for col in defect_display.columns)}
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {''.join(
-                '<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>'
-                for _, row in defect_display.iterrows()
-            )}
-                    </tbody>
-                </table>
+            buf.write(f"""
+            <div class="table-section" id="{section_id}">
+                <h2>{heading} ({len(df)} total)</h2>
+""")
+            self._render_table(df, table_id, buf)
+            buf.write("""
             </div>
-            """
+""")
 
-        return tables_html
-
-    def _create_html_template(
-            self,
-            summary_html: str,
-            charts_html: str,
-            tables_html: str
-    ) -> str:
-        """Create complete HTML template."""
+        return buf.getvalue()
 
-        return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Sprint Report - {self.config.sprint_name}</title>
-
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.6/css/dataTables.bootstrap5.min.css">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js" charset="utf-8"></script>
-    <script src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
-    <script src="https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js"></script>
-    <script src="https://cdn.datatables.net/1.13.6/js/dataTables.bootstrap5.min.js"></script>
-
-    <style>
-        :root {{
-            --primary-color: #0066cc;
-            --secondary-color: #6c757d;
-            --success-color: #28a745;
-            --warning-color: #ffc107;
-            --danger-color: #dc3545;
-            --light-bg: #f8f9fa;
-            --dark-text: #212529;
-        }}
-
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: var(--dark-text);
-            line-height: 1.6;
-            padding: 20px;
-        }}
-
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 10px 40px rgba(0, 0, 0, 0.2);
-            overflow: hidden;
-        }}
+    @staticmethod
+    def _render_table(df: pd.DataFrame, table_id: str, buf: io.StringIO):
+        """Write a DataFrame as an escaped DataTables-ready HTML table."""
+        df.to_html(
+            buf=buf,
+            index=False,
+            table_id=table_id,
+            classes='display data-table',
+            escape=True,
+            border=0,
+            na_rep='',
+            justify='left'
+        )
 
-        .header {{
-            background: linear-gradient(135deg, var(--primary-color) 0%, #004999 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
 
-        .header h1 {{
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }}
+# ============================================================================
+# NEW CLASSES: Screenshot Capture & Email Report Builder
+# ============================================================================
 
-        .header .meta-info {{
-            font-size: 1rem;
-            opacity: 0.9;
-        }}
+# Chromium kept alive between captures in thread-local storage, because
+# Playwright's sync API is bound to the thread that started it. Thread ids
+# are reused, so keying by id could hand a new thread a dead thread's browser.
+_BROWSER_LOCAL = threading.local()
 
-        .content {{
-            padding: 40px;
-        }}
+# Every live pooled browser, only so the exit hook can close them all
+_BROWSER_POOL: List[Dict] = []
+_BROWSER_POOL_LOCK = threading.Lock()
 
-        .summary-cards {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 40px;
-        }}
+# Captures served by one browser before it is closed and relaunched
+BROWSER_POOL_RECYCLE_AFTER = int(os.getenv('BROWSER_POOL_RECYCLE_AFTER', '100'))
 
-        .summary-card {{
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            border-radius: 12px;
-            padding: 25px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
 
-        .summary-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 15px rgba(0, 0, 0, 0.2);
-        }}
+def _chromium_launch_options() -> Dict:
+    """Keyword arguments for chromium.launch, honouring CHROMIUM_PATH."""
+    # Check if custom chromium path is provided
+    chromium_path = os.getenv('CHROMIUM_PATH')
+    launch_options = {'headless': True, 'args': ['--disable-dev-shm-usage']}
 
-        .summary-card h3 {{
-            font-size: 1rem;
-            color: var(--secondary-color);
-            margin-bottom: 15px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
+    if chromium_path and os.path.exists(chromium_path):
+        logger.info(f"Using custom Chromium from: {chromium_path}")
+        launch_options['executable_path'] = chromium_path
+    else:
+        logger.info("Using Playwright-managed Chromium")
 
-        .big-number {{
-            font-size: 3rem;
-            font-weight: 700;
-            color: var(--primary-color);
-            margin-bottom: 15px;
-        }}
+    return launch_options
 
-        .progress-bar {{
-            height: 8px;
-            background: #e9ecef;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-bottom: 10px;
-        }}
 
-        .progress-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, var(--success-color) 0%, #20c997 100%);
-            transition: width 1s ease;
-        }}
+def _launch_browser():
+    """Start Playwright and launch headless Chromium."""
+    from playwright.sync_api import sync_playwright
 
-        .progress-fill.defect {{
-            background: linear-gradient(90deg, var(--warning-color) 0%, #fd7e14 100%);
-        }}
+    playwright = sync_playwright().start()
 
-        .stat-detail {{
-            font-size: 0.9rem;
-            color: var(--secondary-color);
-        }}
+    try:
+        browser = playwright.chromium.launch(**_chromium_launch_options())
+    except Exception:
+        playwright.stop()
+        raise
 
-        .chart-section {{
-            margin-bottom: 50px;
-        }}
+    return {'playwright': playwright, 'browser': browser, 'uses': 0}
 
-        .chart-section h2 {{
-            font-size: 1.8rem;
-            margin-bottom: 25px;
-            color: var(--dark-text);
-            border-bottom: 3px solid var(--primary-color);
-            padding-bottom: 10px;
-        }}
 
-        .charts-row {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 30px;
-            margin-bottom: 30px;
-        }}
+def _close_pooled_browser(entry: Dict):
+    """Close a pooled browser and its Playwright driver, ignoring shutdown errors."""
+    for close in (entry['browser'].close, entry['playwright'].stop):
+        try:
+            close()
+        except Exception as e:
+            logger.debug(f"Error shutting down Chromium: {e}")
 
-        .chart-container {{
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }}
 
-        .chart-container.full-width {{
-            grid-column: 1 / -1;
-        }}
+def checkout_browser():
+    """
+    Return this thread's pooled Chromium browser, launching it on first use.
 
-        .table-section {{
-            margin-bottom: 50px;
-        }}
+    The browser is relaunched after BROWSER_POOL_RECYCLE_AFTER checkouts
+    or if it has disconnected, so long-running processes don't accumulate
+    renderer state. The lock only guards the shared list; launching and
+    closing happen outside it so other threads' checkouts aren't held up.
+    """
+    entry = getattr(_BROWSER_LOCAL, 'entry', None)
 
-        .table-section h2 {{
-            font-size: 1.8rem;
-            margin-bottom: 20px;
-            color: var(--dark-text);
-            border-bottom: 3px solid var(--primary-color);
-            padding-bottom: 10px;
-        }}
+    if entry and (entry['uses'] >= BROWSER_POOL_RECYCLE_AFTER or not entry['browser'].is_connected()):
+        logger.info("Recycling pooled Chromium")
+        release_browser()
+        entry = None
 
-        .data-table {{
-            width: 100% !important;
-            font-size: 0.9rem;
-        }}
+    if entry is None:
+        entry = _BROWSER_LOCAL.entry = _launch_browser()
+        with _BROWSER_POOL_LOCK:
+            _BROWSER_POOL.append(entry)
 
-        .data-table thead th {{
-            background: var(--primary-color);
-            color: white;
-            font-weight: 600;
-            text-transform: uppercase;
-            font-size: 0.85rem;
-            letter-spacing: 0.5px;
-            padding: 12px 8px;
-        }}
+    entry['uses'] += 1
+    return entry['browser']
 
-        .data-table tbody td {{
-            padding: 10px 8px;
-            vertical-align: middle;
-        }}
 
-        .data-table tbody tr:hover {{
-            background-color: #f1f3f5;
-        }}
+def release_browser():
+    """
+    Close the calling thread's pooled browser, if it has one.
 
-        .footer {{
-            background: #2c3e50;
-            color: white;
-            text-align: center;
-            padding: 25px;
-            font-size: 0.9rem;
-        }}
+    Browsers belonging to other threads are left alone: the sync Playwright
+    API can only be driven from the thread that started it.
+    """
+    entry = getattr(_BROWSER_LOCAL, 'entry', None)
+    if entry is None:
+        return
 
-        @media (max-width: 768px) {{
-            .header h1 {{
-                font-size: 2rem;
-            }}
+    _BROWSER_LOCAL.entry = None
+    with _BROWSER_POOL_LOCK:
+        _BROWSER_POOL.remove(entry)
 
-            .charts-row {{
-                grid-template-columns: 1fr;
-            }}
+    _close_pooled_browser(entry)
 
-            .summary-cards {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header" id="header-section">
-            <h1><i class="fas fa-chart-line"></i> Sprint Report</h1>
-            <div class="meta-info">
-                <strong>{self.config.sprint_name}</strong>
 
-                Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
-            </div>
-        </div>
+def _shutdown_browser_pool():
+    """
+    Close every pooled browser at interpreter exit.
 
-        <div class="content">
-            {summary_html}
-            {charts_html}
-            {tables_html}
-        </div>
+    The exiting thread's browser is closed normally. Any left behind by
+    threads that finished without calling release_browser() are closed on
+    a best-effort basis, since nothing can use them any more.
+    """
+    release_browser()
 
-        <div class="footer">
-            <p><i class="fas fa-code"></i> Auto-generated Sprint Report | JIRA Agile API Integration</p>
-            <p>&copy; {datetime.now().year} - Powered by Python & Plotly</p>
-        </div>
-    </div>
+    with _BROWSER_POOL_LOCK:
+        leftovers = _BROWSER_POOL[:]
+        _BROWSER_POOL.clear()
 
-    <script>
-        $(document).ready(function() {{
-            $('.data-table').DataTable({{
-                pageLength: 25,
-                order: [[8, 'desc']],
-                responsive: true,
-                language: {{
-                    search: "Filter records:",
-                    lengthMenu: "Show _MENU_ entries per page",
-                    info: "Showing _START_ to _END_ of _TOTAL_ entries"
-                }}
-            }});
-        }});
-    </script>
-</body>
-</html>
-"""
+    for entry in leftovers:
+        _close_pooled_browser(entry)
 
 
-# ============================================================================
-# NEW CLASSES: Screenshot Capture & Email Report Builder
-# ============================================================================
+atexit.register(_shutdown_browser_pool)
+
 
 class ReportScreenshotter:
     """Captures screenshots of HTML report sections using Playwright."""
 
+    # (section name, CSS selector, screenshot file), in capture order
+    SECTIONS = (
+        ('header', '#header-section', 'header.png'),
+        ('summary', '#summary-section', 'summary.png'),
+        ('story_charts', '#story-charts-section', 'story_charts.png'),
+        ('defect_charts', '#defect-charts-section', 'defect_charts.png'),
+        ('stories_table', '#stories-table-section', 'stories_table.png'),
+        ('defects_table', '#defects-table-section', 'defects_table.png'),
+    )
+
+    # Milliseconds to wait for CDN scripts and chart rendering
+    RENDER_TIMEOUT = 15000
+
+    # Tallest viewport used for single-layout capture (Chromium texture limit)
+    MAX_VIEWPORT_HEIGHT = 16384
+
+    # Sections resized with LANCZOS, where thin chart lines would alias;
+    # the flat header, cards and tables use the much cheaper BILINEAR
+    LANCZOS_SECTIONS = frozenset({'story_charts', 'defect_charts'})
+
+    # True once every Plotly chart placeholder has been laid out
+    PLOTLY_READY_JS = """
+    () => Array.from(document.querySelectorAll('.plotly-graph-div')).every(el => el._fullLayout)
+    """
+
+    # Resize charts to the final viewport; resolves when the relayout is done
+    PLOTLY_RESIZE_JS = """
+    () => window.Plotly && Promise.all(
+        Array.from(document.querySelectorAll('.js-plotly-plot')).map(el => Plotly.Plots.resize(el))
+    )
+    """
+
+    # Selector -> document-relative bounding box (null if absent), in one round trip
+    SECTION_RECTS_JS = """
+    selectors => Object.fromEntries(selectors.map(selector => {
+        const el = document.querySelector(selector);
+        if (!el) return [selector, null];
+        const r = el.getBoundingClientRect();
+        return [selector, {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height}];
+    }))
+    """
+
     def __init__(self, config: JIRAConfig):
         self.config = config
+        # Only written to when debug logging is on; images otherwise stay in memory
         self.screenshot_dir = Path('report_screenshots')
-        self.screenshot_dir.mkdir(exist_ok=True)
 
-    def capture_report_sections(self, html_file: str) -> Dict[str, str]:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shut down this thread's pooled Chromium (done for the main thread at exit)."""
+        release_browser()
+
+    def capture_report_sections(self, html_file: str) -> Dict[str, bytes]:
         """
         Capture screenshots of different report sections.
 
+        Instead of fixed sleeps, waits for the network to go idle and for
+        every Plotly chart to be laid out. The viewport is then grown to the
+        full page height, all section bounding boxes are looked up in a
+        single evaluate call, and each screenshot is clipped from that one
+        layout. The page is opened in a fresh context on the pooled
+        browser, so Chromium is only launched once per process. Images are
+        kept in memory as PNG bytes rather than written to disk.
+
+        With SCREENSHOT_PARALLEL enabled, sections are captured
+        concurrently by capture_report_sections_async instead.
+
         Args:
             html_file: Path to HTML report file
 
         Returns:
-            Dictionary mapping section names to screenshot file paths
+            Dictionary mapping section names to PNG screenshot bytes
         """
+        if self.config.screenshot_parallel:
+            import asyncio
+            return asyncio.run(self.capture_report_sections_async(html_file))
+
         try:
-            from playwright.sync_api import sync_playwright
+            from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         except ImportError:
             logger.error("Playwright not installed. Install with: pip install playwright")
             logger.error("Then run: playwright install chromium")
@@ -925,215 +1372,222 @@ class ReportScreenshotter:
         screenshots = {}
         html_path = Path(html_file).absolute()
 
-        with sync_playwright() as p:
-            # Check if custom chromium path is provided
-            chromium_path = os.getenv('CHROMIUM_PATH')
-
-            if chromium_path and os.path.exists(chromium_path):
-                logger.info(f"Using custom Chromium from: {chromium_path}")
-                browser = p.chromium.launch(
-                    executable_path=chromium_path,
-                    headless=True
-                )
-            else:
-                logger.info("Using Playwright-managed Chromium")
-                browser = p.chromium.launch(headless=True)
-
-            page = browser.new_page(viewport={'width': self.config.screenshot_width, 'height': 1080})
+        browser = checkout_browser()
+        context = browser.new_context(viewport={'width': self.config.screenshot_width, 'height': 1080})
 
-            page.wait_for_timeout(1500)
+        try:
+            page = context.new_page()
 
             # Load the HTML file
             page.goto(f'file://{html_path}')
 
-            # Wait for page to fully load (including plotly charts)
-            page.wait_for_timeout(3000)  # 3 seconds for charts to render
+            # Wait for CDN scripts and chart rendering rather than sleeping
+            try:
+                page.wait_for_load_state('networkidle', timeout=self.RENDER_TIMEOUT)
+                page.wait_for_function(self.PLOTLY_READY_JS, timeout=self.RENDER_TIMEOUT)
+            except PlaywrightTimeoutError:
+                logger.warning("Timed out waiting for charts to render; capturing anyway")
+
+            # Grow the viewport to the whole page so it is laid out and
+            # rastered once, and every section is clipped from that layout
+            page_height = page.evaluate("document.documentElement.scrollHeight")
+            viewport_height = max(1080, min(page_height, self.MAX_VIEWPORT_HEIGHT))
+            page.set_viewport_size({'width': self.config.screenshot_width, 'height': viewport_height})
+
+            page.evaluate(self.PLOTLY_RESIZE_JS)
+
+            selectors = [selector for _, selector, _ in self.SECTIONS]
+            rects = page.evaluate(self.SECTION_RECTS_JS, selectors)
+
+            for section, selector, filename in self.SECTIONS:
+                rect = rects.get(selector)
+                if not rect or not rect['width'] or not rect['height']:
+                    logger.debug(f"  - Section not in report: {selector}")
+                    continue
 
-            page.evaluate("""
-            if (window.Plotly) {
-            document.querySelectorAll('.js-plotly-plot').forEach(el => {
-            Plotly.Plots.resize(el);
-            });
-            }
-            """)
-
-            page.wait_for_timeout(1000)
-            # Capture header
-            logger.info("Capturing header...")
-            screenshots['header'] = self._capture_element(page, '#header-section', 'header.png')
-
-            # Capture summary cards
-            logger.info("Capturing summary section...")
-            screenshots['summary'] = self._capture_element(page, '#summary-section', 'summary.png')
-
-            # Capture story charts
-            if page.query_selector('#story-charts-section'):
-                logger.info("Capturing story charts...")
-                screenshots['story_charts'] = self._capture_element(page, '#story-charts-section', 'story_charts.png')
-
-            # Capture defect charts
-            if page.query_selector('#defect-charts-section'):
-                logger.info("Capturing defect charts...")
-                screenshots['defect_charts'] = self._capture_element(page, '#defect-charts-section',
-                                                                     'defect_charts.png')
-
-            # Capture stories table
-            if page.query_selector('#stories-table-section'):
-                logger.info("Capturing stories table...")
-                screenshots['stories_table'] = self._capture_element(page, '#stories-table-section',
-                                                                     'stories_table.png')
-
-            # Capture defects table
-            if page.query_selector('#defects-table-section'):
-                logger.info("Capturing defects table...")
-                screenshots['defects_table'] = self._capture_element(page, '#defects-table-section',
-                                                                     'defects_table.png')
-
-            browser.close()
+                logger.info(f"Capturing {section.replace('_', ' ')}...")
+                try:
+                    # Only pages taller than the viewport cap need a full-page capture
+                    beyond_viewport = rect['y'] + rect['height'] > viewport_height
+                    screenshots[section] = page.screenshot(clip=rect, full_page=beyond_viewport)
+                    logger.info(f"  ✓ Captured: {filename}")
+                except Exception as e:
+                    logger.error(f"  ✗ Error capturing {selector}: {e}")
+                    continue
+
+                self._save_debug_copy(filename, screenshots[section])
+        finally:
+            context.close()
 
         logger.info(f"Captured {len(screenshots)} screenshots")
         return screenshots
 
-    def _capture_element(self, page, selector: str, filename: str) -> str:
-        """Capture screenshot of a specific element."""
-        element = page.query_selector(selector)
-        if element:
-            screenshot_path = self.screenshot_dir / filename
-            element.screenshot(path=str(screenshot_path))
-            logger.info(f"  ✓ Saved: {filename}")
-            return str(screenshot_path)
-        else:
-            logger.warning(f"  ✗ Element not found: {selector}")
-            return None
-
-    def resize_images(self, screenshots: Dict[str, str]) -> Dict[str, str]:
+    async def capture_report_sections_async(self, html_file: str) -> Dict[str, bytes]:
         """
-        Resize images to be email-friendly.
+        Capture report sections concurrently, one browser tab per section.
+
+        Every tab loads and renders the report on its own, so waiting and
+        rasterization overlap across sections. Concurrency is capped at the
+        CPU count.
 
         Args:
-            screenshots: Dictionary of screenshot paths
+            html_file: Path to HTML report file
 
         Returns:
-            Dictionary of resized image paths
+            Dictionary mapping section names to PNG screenshot bytes
         """
-        logger.info("Resizing images for email...")
+        import asyncio
 
-        resized_dir = Path('report_screenshots_resized')
-        resized_dir.mkdir(exist_ok=True)
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            logger.error("Playwright not installed. Install with: pip install playwright")
+            logger.error("Then run: playwright install chromium")
+            raise ImportError("Playwright is required for screenshot capture")
 
-        resized_screenshots = {}
-        max_width = self.config.email_image_max_width
+        logger.info("Starting parallel screenshot capture...")
 
-        for section, img_path in screenshots.items():
-            if not img_path or not os.path.exists(img_path):
-                continue
+        html_url = f'file://{Path(html_file).absolute()}'
+        semaphore = asyncio.Semaphore(min(len(self.SECTIONS), os.cpu_count() or 1))
 
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(**_chromium_launch_options())
             try:
-                with Image.open(img_path) as img:
-                    # Calculate new dimensions
-                    if img.width > max_width:
-                        ratio = max_width / img.width
-                        new_height = int(img.height * ratio)
-                        img_resized = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-                    else:
-                        img_resized = img
-
-                    # Save resized image
-                    resized_path = resized_dir / Path(img_path).name
-                    img_resized.save(resized_path, optimize=True, quality=85)
-                    resized_screenshots[section] = str(resized_path)
-
-                    logger.info(f"  ✓ Resized: {section}")
-
-            except Exception as e:
-                logger.error(f"  ✗ Error resizing {section}: {e}")
-                resized_screenshots[section] = img_path  # Use original if resize fails
-
-        return resized_screenshots
+                images = await asyncio.gather(*[
+                    self._capture_section_async(browser, semaphore, html_url, selector, filename)
+                    for _, selector, filename in self.SECTIONS
+                ])
+            finally:
+                await browser.close()
 
+        screenshots = {}
+        for (section, _, filename), data in zip(self.SECTIONS, images):
+            if data:
+                screenshots[section] = data
+                self._save_debug_copy(filename, data)
 
-class EmailReportBuilder:
-    """Builds email-friendly HTML reports with embedded images."""
+        logger.info(f"Captured {len(screenshots)} screenshots")
+        return screenshots
 
-    def __init__(self, config: JIRAConfig):
-        self.config = config
+    async def _capture_section_async(self, browser, semaphore: 'asyncio.Semaphore',
+                                     html_url: str, selector: str, filename: str) -> Optional[bytes]:
+        """Load the report in a fresh context and capture one section."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-    def build_email_html(self, screenshots: Dict[str, str]) -> str:
+        async with semaphore:
+            context = await browser.new_context(viewport={'width': self.config.screenshot_width, 'height': 1080})
+            try:
+                page = await context.new_page()
+                await page.goto(html_url)
+
+                try:
+                    await page.wait_for_load_state('networkidle', timeout=self.RENDER_TIMEOUT)
+                    await page.wait_for_function(self.PLOTLY_READY_JS, timeout=self.RENDER_TIMEOUT)
+                except PlaywrightTimeoutError:
+                    logger.warning(f"Timed out waiting for charts to render; capturing {selector} anyway")
+
+                await page.evaluate(self.PLOTLY_RESIZE_JS)
+
+                element = page.locator(selector)
+                if not await element.count():
+                    logger.debug(f"  - Section not in report: {selector}")
+                    return None
+
+                data = await element.screenshot()
+                logger.info(f"  ✓ Captured: {filename}")
+                return data
+            finally:
+                await context.close()
+
+    def _save_debug_copy(self, filename: str, data: Optional[bytes]):
+        """Write a captured screenshot to disk when debug logging is on."""
+        if data and logger.isEnabledFor(logging.DEBUG):
+            self.screenshot_dir.mkdir(exist_ok=True)
+            (self.screenshot_dir / filename).write_bytes(data)
+
+    def resize_images(self, screenshots: Dict[str, bytes]) -> Dict[str, bytes]:
         """
-        Build email-friendly HTML with embedded images.
+        Resize images to be email-friendly.
+
+        Images are resized on a thread pool; Pillow releases the GIL while
+        resampling and encoding, so the screenshots are processed in parallel.
 
         Args:
-            screenshots: Dictionary of screenshot paths
+            screenshots: Dictionary of PNG screenshot bytes
 
         Returns:
-            HTML content for email
+            Dictionary of resized JPEG image bytes
         """
-        logger.info("Building email-friendly HTML...")
+        logger.info("Resizing images for email...")
 
-        # Generate CID references for images
-        image_sections = []
-
-        # Header
-        if 'header' in screenshots and screenshots['header']:
-            image_sections.append({
-                'cid': 'header',
-                'path': screenshots['header'],
-                'alt': 'Sprint Report Header'
-            })
-
-        # Summary
-        if 'summary' in screenshots and screenshots['summary']:
-            image_sections.append({
-                'cid': 'summary',
-                'path': screenshots['summary'],
-                'alt': 'Sprint Summary'
-            })
+        max_width = self.config.email_image_max_width
 
-        # Story charts
-        if 'story_charts' in screenshots and screenshots['story_charts']:
-            image_sections.append({
-                'cid': 'story_charts',
-                'path': screenshots['story_charts'],
-                'alt': 'Story Metrics'
-            })
+        pending = {section: data for section, data in screenshots.items() if data}
+        if not pending:
+            return {}
 
-        # Defect charts
-        if 'defect_charts' in screenshots and screenshots['defect_charts']:
-            image_sections.append({
-                'cid': 'defect_charts',
-                'path': screenshots['defect_charts'],
-                'alt': 'Defect Metrics'
-            })
-
-        # Stories table
-        if 'stories_table' in screenshots and screenshots['stories_table']:
-            image_sections.append({
-                'cid': 'stories_table',
-                'path': screenshots['stories_table'],
-                'alt': 'Stories Table'
-            })
-
-        # Defects table
-        if 'defects_table' in screenshots and screenshots['defects_table']:
-            image_sections.append({
-                'cid': 'defects_table',
-                'path': screenshots['defects_table'],
-                'alt': 'Defects Table'
-            })
-
-        # Build HTML with table layout
-        html_content = f"""
+        with ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+            resized = executor.map(
+                lambda item: self._resize_one(item[0], item[1], max_width),
+                pending.items()
+            )
+            return dict(zip(pending, resized))
+
+    @classmethod
+    def _resize_one(cls, section: str, data: bytes, max_width: int) -> bytes:
+        """Resize one screenshot; returns the original bytes if resizing fails."""
+        from PIL import Image
+
+        if section in cls.LANCZOS_SECTIONS:
+            resample = Image.Resampling.LANCZOS
+        else:
+            resample = Image.Resampling.BILINEAR
+
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                # Shrink in place to max_width, keeping the aspect ratio (never enlarges).
+                # reducing_gap: box-reduce first, then resample the smaller image
+                img.thumbnail((max_width, img.height), resample, reducing_gap=3.0)
+
+                # Save as progressive JPEG: far smaller than PNG for these
+                # screenshots, and nothing in them needs transparency
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                buf = io.BytesIO()
+                img.save(buf, 'JPEG', quality=82, optimize=True, progressive=True, subsampling=2)
+
+            logger.info(f"  ✓ Resized: {section}")
+            return buf.getvalue()
+
+        except Exception as e:
+            logger.error(f"  ✗ Error resizing {section}: {e}")
+            return data  # Use original if resize fails
+
+
+# Email sections in display order: (image Content-ID, alt text)
+_SECTION_META = (
+    ('header', 'Sprint Report Header'),
+    ('summary', 'Sprint Summary'),
+    ('story_charts', 'Story Metrics'),
+    ('defect_charts', 'Defect Metrics'),
+    ('stories_table', 'Stories Table'),
+    ('defects_table', 'Defects Table'),
+)
+
+# Static pieces of the email HTML, built once at import instead of per email.
+# Styles are repeated inline because Outlook ignores most of the <style> block.
+_EMAIL_HTML_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Sprint Report - {self.config.sprint_name}</title>
+    <title>Sprint Report - {title}</title>
     <style>
         body {{
             margin: 0;
             padding: 0;
-            font-family: Arial, sans-serif;
+            font-family: Arial, Helvetica, sans-serif;
             background-color: #f4f4f4;
         }}
 
@@ -1145,10 +1599,12 @@ class EmailReportBuilder:
 
         .section-image {{
             width: 100%;
+            max-width: 800px;
             height: auto;
             display: block;
             margin: 0;
             padding: 0;
+            border: none;
         }}
 
         .spacer {{
@@ -1158,44 +1614,84 @@ class EmailReportBuilder:
     </style>
 </head>
 <body>
-    <table class="email-container" cellpadding="0" cellspacing="0" border="0" width="100%">
+    <table class="email-container" cellpadding="0" cellspacing="0" border="0" width="100%" style="max-width: 800px; margin: 0 auto;">
 """
 
-        # Add each section as a row
-        for idx, section in enumerate(image_sections):
-            html_content += f"""
+_EMAIL_HTML_SECTION = """
         <tr>
             <td align="center" style="padding: 0;">
-                <img src="cid:{section['cid']}" alt="{section['alt']}" class="section-image" />
+                <img src="cid:{cid}" alt="{alt}" class="section-image" style="width: 100%; max-width: 800px; height: auto; display: block; border: none;" />
             </td>
         </tr>
 """
-            # Add spacer between sections (except after last one)
-            if idx < len(image_sections) - 1:
-                html_content += """
+
+_EMAIL_HTML_SPACER = """
         <tr>
-            <td class="spacer"></td>
+            <td class="spacer" style="height: 20px; background-color: #f4f4f4;"></td>
         </tr>
 """
 
-        html_content += """
+_EMAIL_HTML_TAIL = """
     </table>
 </body>
 </html>
 """
 
-        return html_content
+# Image rows only depend on the section, so they are rendered once here
+_EMAIL_HTML_ROWS = {cid: _EMAIL_HTML_SECTION.format(cid=cid, alt=alt) for cid, alt in _SECTION_META}
+
+
+class EmailReportBuilder:
+    """Builds email-friendly HTML reports with embedded images."""
+
+    def __init__(self, config: JIRAConfig):
+        self.config = config
+
+    def build_email_html(self, screenshots: Dict[str, bytes]) -> str:
+        """
+        Build email-friendly HTML with embedded images.
+
+        Args:
+            screenshots: Dictionary of screenshot image bytes
+
+        Returns:
+            HTML content for email
+        """
+        logger.info("Building email-friendly HTML...")
+
+        # The Content-ID of each image is its section name
+        rows = [_EMAIL_HTML_ROWS[cid] for cid, _ in _SECTION_META if screenshots.get(cid)]
+
+        # Spacers go between sections, not before the first or after the last
+        parts = [
+            _EMAIL_HTML_HEAD.format(title=self.config.sprint_name),
+            _EMAIL_HTML_SPACER.join(rows),
+            _EMAIL_HTML_TAIL
+        ]
+
+        return ''.join(parts)
+
+
+# MAPI properties that turn an Outlook attachment into an inline image
+_PR_ATTACH_CONTENT_ID = "http://schemas.microsoft.com/mapi/proptag/0x3712001F"
+_PR_ATTACHMENT_HIDDEN = "http://schemas.microsoft.com/mapi/proptag/0x7FFE000B"
 
 
 class EmailSender:
     """Handles email delivery via Outlook or SMTP with embedded screenshots."""
 
+    # OS keyring service name under which the SMTP password is cached
+    KEYRING_SERVICE = 'jira-sprint-reporter-smtp'
+
+    # Outlook automation needs Windows and pywin32; checked once at import
+    _HAS_OUTLOOK = sys.platform == 'win32' and importlib.util.find_spec('win32com') is not None
+
     def __init__(self, config: JIRAConfig):
         self.config = config
 
     def send_email_with_screenshots(
             self,
-            screenshots: Dict[str, str],
+            screenshots: Dict[str, bytes],
             email_html: str,
             subject: Optional[str] = None
     ) -> bool:
@@ -1203,7 +1699,7 @@ class EmailSender:
         Send email with embedded screenshot images.
 
         Args:
-            screenshots: Dictionary of screenshot paths
+            screenshots: Dictionary of screenshot image bytes
             email_html: HTML content for email
             subject: Email subject
 
@@ -1217,10 +1713,11 @@ class EmailSender:
         subject = subject or f"Sprint Report - {self.config.sprint_name}"
 
         # Try Outlook first
-        try:
-            return self._send_via_outlook(screenshots, email_html, subject)
-        except Exception as e:
-            logger.info(f"Outlook not available: {e}")
+        if self._HAS_OUTLOOK:
+            try:
+                return self._send_via_outlook(screenshots, email_html, subject)
+            except Exception as e:
+                logger.info(f"Outlook not available: {e}")
 
         #Fallback to SMTP
         if self.config.smtp_server:
@@ -1235,7 +1732,7 @@ class EmailSender:
 
     def _send_via_outlook(
             self,
-            screenshots: Dict[str, str],
+            screenshots: Dict[str, bytes],
             email_html: str,
             subject: str
     ) -> bool:
@@ -1255,50 +1752,47 @@ class EmailSender:
         mail.Cc = '; '.join(self.config.email_cc_recipients)
         mail.BodyFormat = 2  # 2 = HTML format
 
-        # Build HTML body with proper CID references for Outlook
-        # Outlook uses cid:imagename.png format
-        html_with_attachments = self._build_outlook_html(screenshots)
-        mail.HTMLBody = html_with_attachments
+        # The email HTML references each image as cid:<section>, matching
+        # the Content-ID set on its attachment below
+        mail.HTMLBody = email_html
 
         # Attach images and set them as inline/embedded
-        attachment_index = 1
         logger.info("Starting Screen shot adding.")
-        # Attach images as inline
-        MAPI_PROP_CONTENT_ID = "http://schemas.microsoft.com/mapi/proptag/0x3712001F"
-        MAPI_PROP_HIDDEN = "http://schemas.microsoft.com/mapi/proptag/0x7FFE000B"
 
-        for section, img_path in screenshots.items():
-            if not img_path or not os.path.exists(img_path):
-                logger.warning(f"Skipping {section} — file not found: {img_path}")
-                continue
+        # Bound once: every COM attribute lookup is an out-of-process call
+        add_attachment = mail.Attachments.Add
 
-            try:
-                # ────────────────────────────────────────────────
-                # Make absolutely sure we have a Windows-friendly path
-                abs_path = os.path.abspath(img_path)  # resolves relative paths
-                win_path = str(Path(abs_path).resolve())  # pathlib helps clean it
-                win_path = win_path.replace('/', '\\')  # force backslashes
-
-                if not os.path.exists(win_path):
-                    logger.error(f"File really does not exist: {win_path}")
+        # Attachments.Add copies the file into the message, so the temp
+        # files can be removed as soon as they are attached
+        with tempfile.TemporaryDirectory(prefix='jira_report_') as tmp_dir:
+            for section, data in screenshots.items():
+                if not data:
+                    logger.warning(f"Skipping {section} — no image captured")
                     continue
 
-                logger.debug(f"Attaching full path: {win_path}")
+                # Outlook can only attach files, so each image is written out once
+                img_path = os.path.join(tmp_dir, f"{section}.{self._image_subtype(data)}")
+                with open(img_path, 'wb') as f:
+                    f.write(data)
 
-                attachment = mail.Attachments.Add(win_path)
+                try:
+                    # Absolute, native-separator path for COM; the file was just
+                    # written, so no existence check or symlink resolution is needed
+                    win_path = os.fspath(Path(img_path).absolute())
 
-                # Rest remains the same
-                filename = os.path.basename(win_path)
-                pr_attach_content_id = "http://schemas.microsoft.com/mapi/proptag/0x3712001F"
-                attachment.PropertyAccessor.SetProperty(pr_attach_content_id, f"<{section}>")
+                    logger.debug(f"Attaching full path: {win_path}")
 
-                pr_attachment_hidden = "http://schemas.microsoft.com/mapi/proptag/0x7FFE000B"
-                attachment.PropertyAccessor.SetProperty(pr_attachment_hidden, True)
+                    attachment = add_attachment(win_path)
 
-                logger.info(f"  ✓ Attached: {filename} as CID:<{section}> from {win_path}")
+                    filename = os.path.basename(win_path)
+                    property_accessor = attachment.PropertyAccessor
+                    property_accessor.SetProperty(_PR_ATTACH_CONTENT_ID, f"<{section}>")
+                    property_accessor.SetProperty(_PR_ATTACHMENT_HIDDEN, True)
 
-            except Exception as attach_err:
-                logger.error(f"Failed to attach {section}: {attach_err}", exc_info=True)
+                    logger.info(f"  ✓ Attached: {filename} as CID:<{section}> from {win_path}")
+
+                except Exception as attach_err:
+                    logger.error(f"Failed to attach {section}: {attach_err}", exc_info=True)
 
         try:
             # Option A: send directly
@@ -1312,148 +1806,65 @@ class EmailSender:
             logger.error(f"Outlook send failed: {e}")
             return False
 
-    def _build_outlook_html(self, screenshots: Dict[str, str]) -> str:
-        """
-        Build Outlook-specific HTML with proper CID references.
-
-        Outlook requires cid: references to match the Content-ID of attachments.
-        """
-        # Generate image sections
-        image_sections = []
-
-        section_order = ['header', 'summary', 'story_charts', 'defect_charts', 'stories_table', 'defects_table']
-        section_titles = {
-            'header': 'Sprint Report Header',
-            'summary': 'Sprint Summary',
-            'story_charts': 'Story Metrics',
-            'defect_charts': 'Defect Metrics',
-            'stories_table': 'Stories Table',
-            'defects_table': 'Defects Table'
-        }
-
-        for section in section_order:
-            if section in screenshots and screenshots[section]:
-                image_sections.append({
-                    'cid': section,
-                    'alt': section_titles.get(section, section.replace('_', ' ').title())
-                })
-
-        # Build HTML
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            font-family: Arial, Helvetica, sans-serif;
-            background-color: #f4f4f4;
-        }}
-        .email-container {{
-            max-width: 800px;
-            margin: 0 auto;
-            background-color: #ffffff;
-        }}
-        .section-image {{
-            width: 100%;
-            max-width: 800px;
-            height: auto;
-            display: block;
-            margin: 0;
-            padding: 0;
-            border: none;
-        }}
-        .spacer {{
-            height: 15px;
-            background-color: #f4f4f4;
-        }}
-    </style>
-</head>
-<body>
-    <table class="email-container" cellpadding="0" cellspacing="0" border="0" width="100%" style="max-width: 800px; margin: 0 auto;">
-"""
-
-        # Add each image section
-        for idx, section in enumerate(image_sections):
-            html += f"""
-        <tr>
-            <td align="center" style="padding: 0;">
-                <img src="cid:{section['cid']}" alt="{section['alt']}" class="section-image" style="width: 100%; max-width: 800px; height: auto; display: block; border: none;" />
-            </td>
-        </tr>
-"""
-            # Add spacer between sections (except last one)
-            if idx < len(image_sections) - 1:
-                html += """
-        <tr>
-            <td style="height: 15px; background-color: #f4f4f4;"></td>
-        </tr>
-"""
-
-        html += """
-    </table>
-</body>
-</html>
-"""
-
-        return html
-
     def _send_via_smtp(
             self,
-            screenshots: Dict[str, str],
+            screenshots: Dict[str, bytes],
             email_html: str,
             subject: str
     ) -> bool:
         import smtplib
-        import ssl
-        from email.mime.multipart import MIMEMultipart
-        from email.mime.text import MIMEText
-        from email.mime.image import MIMEImage
+        from email.message import EmailMessage
+        from email.policy import SMTP
+
+        from smtp_mailer import SMTPDeliveryUnknown, SMTPMailer
 
         try:
-            context = ssl.create_default_context()
+            if not self._resolve_smtp_password():
+                logger.error("No SMTP password available. Set EMAIL_PASSWORD or store it in the OS keyring.")
+                return False
 
-            msg = MIMEMultipart('related')
+            msg = EmailMessage(policy=SMTP)
             msg['Subject'] = subject
             msg['From'] = self.config.email_user
             msg['To'] = ', '.join(self.config.email_recipients)
             logger.info(f"Attempting login with user: {self.config.email_user}")
-            logger.info(f"Password length: {len(self.config.email_password)}")
+            if self._is_gmail() and not self._looks_like_app_password(self.config.email_password):
+                logger.warning("Password does not look like a 16-character Gmail app password")
             logger.info(f"Recipients: {self.config.email_recipients}")
-            if hasattr(self.config, 'email_cc_recipients') and self.config.email_cc_recipients:
+            if self.config.email_cc_recipients:
                 msg['Cc'] = ', '.join(self.config.email_cc_recipients)
 
             # HTML body
-            msg_alternative = MIMEMultipart('alternative')
-            msg.attach(msg_alternative)
-            msg_alternative.attach(MIMEText(email_html, 'html', 'utf-8'))
-
-            # Embed images
-            for section, img_path in screenshots.items():
-                if not img_path or not os.path.exists(img_path):
-                    logger.warning(f"Skipping missing image: {section} → {img_path}")
+            msg.set_content(email_html, subtype='html')
+
+            # Embed images (add_related turns the body into multipart/related)
+            for section, data in screenshots.items():
+                if not data:
+                    logger.warning(f"Skipping missing image: {section}")
                     continue
-                with open(img_path, 'rb') as f:
-                    img = MIMEImage(f.read())
-                    img.add_header('Content-ID', f'<{section}>')
-                    img.add_header('Content-Disposition', 'inline', filename=os.path.basename(img_path))
-                    msg.attach(img)
+                subtype = self._image_subtype(data)
+                msg.add_related(
+                    data,
+                    maintype='image',
+                    subtype=subtype,
+                    cid=f'<{section}>',
+                    disposition='inline',
+                    filename=f'{section}.{subtype}'
+                )
 
-            logger.info(f"Connecting to {self.config.smtp_server}:{self.config.smtp_port}")
+            # Serialize once; the bytes are reused as-is if the send is retried.
+            # The message tree holds a base64 copy of every image, so drop it
+            # before connecting to keep only the wire bytes alive during the send.
+            payload = msg.as_bytes()
+            del msg
+            logger.info(f"Message size: {len(payload) / 1024:.0f} KB ({len(screenshots)} images)")
 
-            with smtplib.SMTP_SSL(
-                    self.config.smtp_server,
-                    self.config.smtp_port,
-                    context=context
-            ) as server:
-                logger.info(f"logging in...")
-                server.login(self.config.email_user, self.config.email_password)
-                logger.info(f"logged in...")
-                server.send_message(msg)
+            # One envelope for everyone: the server fans out a single DATA
+            with SMTPMailer(self.config) as mailer:
+                refused = mailer.sendmail(self.config.email_user, self._envelope_recipients(), payload)
 
+            for address, (code, response) in refused.items():
+                logger.warning(f"Recipient refused: {address} ({code} {response!r})")
 
             logger.info("Email sent successfully via SMTP")
             return True
@@ -1462,10 +1873,77 @@ class EmailSender:
             logger.error(f"Authentication failed: {e} → most likely wrong app password or 2FA not set up correctly")
             logger.error("→ Go to https://myaccount.google.com/apppasswords and generate a new one")
             return False
+        except SMTPDeliveryUnknown as e:
+            logger.error(f"{e} → the report may already have been delivered, so it was not resent")
+            return False
         except Exception as e:
             logger.error(f"SMTP send failed: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    def _image_subtype(data: bytes) -> str:
+        """MIME image subtype of screenshot bytes (PNG when resizing failed, else JPEG)."""
+        return 'png' if data.startswith(b'\x89PNG\r\n\x1a\n') else 'jpeg'
+
+    def _envelope_recipients(self) -> List[str]:
+        """To and Cc recipients for the SMTP envelope, without duplicates."""
+        seen = set()
+        recipients = []
+        for address in self.config.email_recipients + self.config.email_cc_recipients:
+            if address.lower() not in seen:
+                seen.add(address.lower())
+                recipients.append(address)
+        return recipients
+
+    def _is_gmail(self) -> bool:
+        """Check whether SMTP delivery goes through Gmail."""
+        return (self.config.smtp_server or '').lower().endswith('.gmail.com')
+
+    @staticmethod
+    def _looks_like_app_password(password: str) -> bool:
+        """Gmail app passwords are 16 letters, often shown in groups of four."""
+        compact = password.replace(' ', '')
+        return len(compact) == 16 and compact.isalnum()
+
+    def _resolve_smtp_password(self) -> Optional[str]:
+        """
+        Resolve the SMTP password without prompting on every run.
+
+        Order: EMAIL_PASSWORD, then the OS keyring (optional `keyring`
+        package), then an interactive prompt whose answer is saved to the
+        keyring for subsequent runs.
+        """
+        if self.config.email_password:
+            return self.config.email_password
+
+        try:
+            import keyring
+            from keyring.errors import KeyringError
+        except ImportError:
+            keyring = None
+            logger.debug("keyring not installed; skipping OS keyring lookup")
+
+        password = None
+        if keyring is not None:
+            try:
+                password = keyring.get_password(self.KEYRING_SERVICE, self.config.email_user)
+            except KeyringError as e:
+                logger.warning(f"Could not read SMTP password from keyring: {e}")
+
+        if not password and sys.stdin.isatty():
+            import getpass
+            password = getpass.getpass(f"SMTP password for {self.config.email_user}: ")
+
+            if password and keyring is not None:
+                try:
+                    keyring.set_password(self.KEYRING_SERVICE, self.config.email_user, password)
+                    logger.info("SMTP password saved to OS keyring")
+                except KeyringError as e:
+                    logger.warning(f"Could not save SMTP password to keyring: {e}")
+
+        self.config.email_password = password
+        return password
+
 
 def main():
     """Main execution function."""
@@ -1486,16 +1964,15 @@ def main():
 
         # Fetch sprint issues
         logger.info("Fetching sprint issues...")
-        sprint_issues = jira_client.fetch_sprint_issues()
+        df = jira_client.fetch_sprint_dataframe(
+            cache_ttl=timedelta(minutes=config.cache_ttl_minutes),
+            fields=config.issue_fields
+        )
 
-        if not sprint_issues:
+        if df.empty:
             logger.warning("No issues found")
             return
 
-        # Parse issues
-        logger.info("Parsing issues...")
-        df = IssueParser.parse_issues(sprint_issues)
-
         # Separate stories and defects
         story_df = df[df['Issue Type'].isin(config.story_types)]
         defect_df = df[df['Issue Type'].isin(config.defect_types)]
@@ -0,0 +1,419 @@
+"""
+SMTP transport for the JIRA Sprint Reporter.
+=============================================
+Kept out of jira_report_mailer so that smtplib, ssl and the email machinery
+are only imported when a report is actually sent over SMTP.
+
+Features:
+- Single authenticated session reused across sends (SMTPMailer)
+- PIPELINING of MAIL/RCPT/DATA when the server supports it
+- TLS session resumption on reconnect
+- Exponential backoff on transient failures
+"""
+
+import logging
+import random
+import re
+import smtplib
+import socket
+import ssl
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from jira_report_mailer import JIRAConfig
+
+logger = logging.getLogger(__name__)
+
+# Shared TLS context for SMTP connections; building it parses the system CA
+# bundle, so it is done once per process rather than once per connection.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = True
+_SSL_CTX.minimum_version = ssl.TLSVersion.TLSv1_2
+
+
+# Resolved SMTP server addresses, keyed by (host, port), so reconnects and
+# retries skip DNS. Entries expire after ADDRESS_CACHE_TTL seconds.
+ADDRESS_CACHE_TTL = 300
+_address_cache: Dict[Tuple[str, int], Tuple[float, List[tuple]]] = {}
+_address_cache_lock = threading.Lock()
+
+
+def _resolve(host: str, port: int) -> List[tuple]:
+    """Return the cached socket addresses for host:port, resolving if stale."""
+    key = (host, port)
+    with _address_cache_lock:
+        cached = _address_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+    addresses = [info[4] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)]
+    with _address_cache_lock:
+        _address_cache[key] = (time.monotonic() + ADDRESS_CACHE_TTL, addresses)
+    return addresses
+
+
+def _open_connection(host: str, port: int, timeout, source_address=None) -> socket.socket:
+    """
+    Connect to the first reachable cached address for host:port.
+
+    An address that works after others failed is moved to the front of the
+    cache; if none work the entry is dropped so the next attempt re-resolves.
+    """
+    addresses = _resolve(host, port)
+    last_error = None
+
+    for index, address in enumerate(addresses):
+        try:
+            sock = socket.create_connection(address[:2], timeout, source_address)
+        except OSError as e:
+            last_error = e
+            continue
+
+        if index:
+            with _address_cache_lock:
+                cached = _address_cache.get((host, port))
+                if cached:
+                    reordered = [address] + [a for a in cached[1] if a != address]
+                    _address_cache[(host, port)] = (cached[0], reordered)
+
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    with _address_cache_lock:
+        _address_cache.pop((host, port), None)
+    raise last_error or OSError(f"No addresses found for {host}:{port}")
+
+
+class SMTPDeliveryUnknown(smtplib.SMTPException):
+    """
+    The connection failed after the message data was fully sent.
+
+    The server may already have queued the message, so resending it could
+    deliver a duplicate to every recipient. This is never retried.
+    """
+
+
+class PipeliningMixin:
+    """
+    Pipelines the message envelope (RFC 2920) for smtplib clients.
+
+    When the server advertises PIPELINING, MAIL FROM, every RCPT TO and DATA
+    are written in a single batch and their replies are read back in order,
+    so the envelope costs one round trip instead of one per command. Servers
+    without PIPELINING fall back to the standard smtplib behaviour.
+    """
+
+    # Seconds to wait for the reply to the final "." of DATA. Relays may
+    # scan the whole message first; RFC 5321 4.5.3.2.6 suggests 10 minutes
+    DATA_REPLY_TIMEOUT = 600
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        """Send a message, pipelining the envelope when supported."""
+        self.ehlo_or_helo_if_needed()
+        if not self.has_extn('pipelining'):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+
+        if isinstance(msg, str):
+            msg = re.sub(r'\r\n|\r|\n', '\r\n', msg).encode('ascii')
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+
+        esmtp_opts = list(mail_options)
+        if self.has_extn('size'):
+            esmtp_opts.insert(0, f"size={len(msg)}")
+        if any(option.lower() == 'smtputf8' for option in esmtp_opts):
+            if not self.has_extn('smtputf8'):
+                raise smtplib.SMTPNotSupportedError('SMTPUTF8 not supported by server')
+            self.command_encoding = 'utf-8'
+
+        mail_opts = ''.join(f" {option}" for option in esmtp_opts)
+        rcpt_opts = ''.join(f" {option}" for option in rcpt_options)
+
+        commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}{mail_opts}"]
+        commands.extend(f"RCPT TO:{smtplib.quoteaddr(addr)}{rcpt_opts}" for addr in to_addrs)
+        commands.append("DATA")
+        self.send(''.join(f"{command}\r\n" for command in commands))
+
+        # Replies arrive in the same order the commands were written
+        mail_code, mail_resp = self.getreply()
+
+        refused = {}
+        for addr in to_addrs:
+            code, resp = self.getreply()
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+
+        data_code, data_resp = self.getreply()
+
+        if data_code == 354 and (mail_code != 250 or len(refused) == len(to_addrs)):
+            # DATA was accepted without a valid envelope; end the transaction empty
+            self.send(b'.\r\n')
+            self.getreply()
+
+        if mail_code != 250:
+            self._rset()
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+
+        if len(refused) == len(to_addrs):
+            self._rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        if data_code != 354:
+            self._rset()
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        code, resp = self._send_data(msg)
+        if code != 250:
+            self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+
+        return refused
+
+    def data(self, msg):
+        """Send DATA and the message, flagging a lost final reply (non-pipelined path)."""
+        self.putcmd('data')
+        code, resp = self.getreply()
+        if code != 354:
+            raise smtplib.SMTPDataError(code, resp)
+        if isinstance(msg, str):
+            msg = re.sub(r'\r\n|\r|\n', '\r\n', msg).encode('ascii')
+        return self._send_data(msg)
+
+    def _send_data(self, msg: bytes):
+        """Write the dot-stuffed message and terminator, then read the final reply."""
+        body = re.sub(br'(?m)^\.', b'..', msg)
+        if not body.endswith(b'\r\n'):
+            body += b'\r\n'
+        self.send(body + b'.\r\n')
+
+        timeout = self.sock.gettimeout()
+        if timeout is not None:
+            self.sock.settimeout(max(timeout, self.DATA_REPLY_TIMEOUT))
+
+        try:
+            return self.getreply()
+        except (smtplib.SMTPServerDisconnected, OSError) as e:
+            raise SMTPDeliveryUnknown(f"Connection lost after the message was sent: {e}") from e
+        finally:
+            # getreply() drops the socket when the connection fails
+            if self.sock is not None:
+                self.sock.settimeout(timeout)
+
+
+class PipeliningSMTP(PipeliningMixin, smtplib.SMTP_SSL):
+    """
+    Implicit-TLS (port 465) client with pipelining and pinned addresses.
+
+    A TLS session from an earlier connection can be passed as tls_session
+    so that reconnects resume it instead of doing a full handshake.
+    """
+
+    def __init__(self, *args, tls_session: Optional[ssl.SSLSession] = None, **kwargs):
+        # Must be set before SMTP.__init__, which connects straight away
+        self.tls_session = tls_session
+        super().__init__(*args, **kwargs)
+
+    def _get_socket(self, host, port, timeout):
+        """Open the TLS socket, resuming the stored session if there is one."""
+        if self.debuglevel > 0:
+            self._print_debug('connect:', (host, port))
+        new_socket = _open_connection(host, port, timeout, self.source_address)
+        return self.context.wrap_socket(
+            new_socket,
+            server_hostname=self._host,
+            session=self.tls_session
+        )
+
+
+class PipeliningSMTPStartTLS(PipeliningMixin, smtplib.SMTP):
+    """
+    STARTTLS (port 587) client with pipelining and pinned addresses.
+
+    Only a fallback for servers that do not offer implicit TLS: the
+    plaintext EHLO, STARTTLS and second EHLO cost extra round trips.
+    """
+
+    def _get_socket(self, host, port, timeout):
+        if self.debuglevel > 0:
+            self._print_debug('connect:', (host, port))
+        return _open_connection(host, port, timeout, self.source_address)
+
+
+class SMTPMailer:
+    """
+    Keeps a single authenticated SMTP session open across multiple sends.
+
+    The TLS handshake and AUTH are paid once per connection instead of once
+    per message. Between sends the session is probed with NOOP and is only
+    re-established when the server has dropped it or when the reuse limits
+    below are reached.
+
+    Transient failures (dropped connections, timeouts, DNS errors, 4xx
+    replies) are retried with exponential backoff; authentication failures
+    and permanent 5xx replies are raised immediately. A connection lost
+    after the message data was sent raises SMTPDeliveryUnknown instead of
+    retrying, since the server may already have accepted the message.
+
+    Usage:
+        with SMTPMailer(config) as mailer:
+            for data in batch:
+                mailer.sendmail(from_addr, to_addrs, data)
+    """
+
+    # Upper bounds on connection reuse (messages sent / seconds since login)
+    MAX_MESSAGES_PER_CONNECTION = 10000
+    MAX_CONNECTION_AGE = 300
+
+    # Retry policy for transient failures (attempts / cap on delay in seconds)
+    MAX_RETRIES = 5
+    MAX_BACKOFF = 32
+
+    # Socket timeout in seconds, so a stalled server fails instead of hanging
+    TIMEOUT = 30
+
+    def __init__(self, config: 'JIRAConfig'):
+        self.config = config
+        self.server = None
+        self._tls_session = None
+        self._messages_sent = 0
+        self._connected_at = 0.0
+
+    def __enter__(self) -> 'SMTPMailer':
+        self._call_with_retry(self.connect)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def connect(self):
+        """Open the SMTP connection and log in."""
+        logger.info(f"Connecting to {self.config.smtp_server}:{self.config.smtp_port}")
+
+        if self.config.smtp_use_ssl:
+            self.server = PipeliningSMTP(
+                self.config.smtp_server,
+                self.config.smtp_port,
+                timeout=self.TIMEOUT,
+                context=_SSL_CTX,
+                tls_session=self._tls_session
+            )
+        else:
+            logger.info("Using STARTTLS (implicit TLS is faster if the server offers it)")
+            self.server = PipeliningSMTPStartTLS(
+                self.config.smtp_server,
+                self.config.smtp_port,
+                timeout=self.TIMEOUT
+            )
+
+        try:
+            if not self.config.smtp_use_ssl:
+                self.server.starttls(context=_SSL_CTX)
+
+            logger.debug(f"TLS session reused: {self.server.sock.session_reused}")
+
+            logger.info("logging in...")
+            self.server.login(self.config.email_user, self.config.email_password)
+            logger.info("logged in...")
+        except Exception:
+            # Don't leak the open socket when the handshake or login fails
+            self.close()
+            raise
+
+        # TLS 1.3 tickets arrive after the handshake, so grab the session
+        # once the first exchange has completed
+        self._tls_session = self.server.sock.session
+
+        self._messages_sent = 0
+        self._connected_at = time.monotonic()
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], data: bytes) -> Dict[str, tuple]:
+        """
+        Send an already-serialized message with an explicit envelope.
+
+        Callers that flatten the message once (e.g. with msg.as_bytes())
+        skip send_message's per-call header walk and re-generation, and
+        retries resend the same bytes. Passing every recipient here sends
+        one MAIL, one RCPT per address and a single DATA, leaving the
+        fan-out to the server.
+
+        Returns:
+            Recipients the server refused, mapped to (code, response)
+        """
+        refused = self._call_with_retry(lambda: self._sendmail_once(from_addr, to_addrs, data))
+        self._messages_sent += 1
+        return refused
+
+    def close(self):
+        """Quit the SMTP session if one is open."""
+        if self.server is None:
+            return
+
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            self.server.close()
+        finally:
+            self.server = None
+
+    def _sendmail_once(self, from_addr: str, to_addrs: List[str], data: bytes):
+        """Send serialized message data, opening a new session first if needed."""
+        if not self._is_reusable():
+            self.close()
+            self.connect()
+
+        return self.server.sendmail(from_addr, to_addrs, data)
+
+    def _call_with_retry(self, operation):
+        """Run an SMTP operation, retrying transient failures with backoff."""
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                return operation()
+            except Exception as e:
+                if attempt == self.MAX_RETRIES - 1 or not self._is_transient(e):
+                    raise
+
+                delay = min(2 ** attempt + random.random(), self.MAX_BACKOFF)
+                logger.warning(f"Transient SMTP error: {e} → retrying in {delay:.1f}s")
+
+                # Drop the session so the next attempt starts from a clean connection
+                self.close()
+                time.sleep(delay)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Decide whether an SMTP failure is worth retrying."""
+        if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+            return True
+
+        if isinstance(error, smtplib.SMTPAuthenticationError):
+            return False
+
+        if isinstance(error, smtplib.SMTPResponseException):
+            return 400 <= error.smtp_code < 500
+
+        if isinstance(error, ssl.SSLCertVerificationError):
+            return False
+
+        return isinstance(error, (socket.timeout, socket.gaierror, ssl.SSLError, ConnectionError))
+
+    def _is_reusable(self) -> bool:
+        """Check whether the current session can carry another message."""
+        if self.server is None:
+            return False
+
+        if self._messages_sent >= self.MAX_MESSAGES_PER_CONNECTION:
+            return False
+
+        if time.monotonic() - self._connected_at >= self.MAX_CONNECTION_AGE:
+            return False
+
+        # A freshly opened session does not need a liveness probe
+        if self._messages_sent == 0:
+            return True
+
+        try:
+            return self.server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
@@ -0,0 +1,220 @@
+"""Tests for the pipelined SMTP client against an in-process fake server."""
+
+import smtplib
+import socket
+import threading
+import time
+
+import pytest
+
+import smtp_mailer
+from smtp_mailer import PipeliningSMTPStartTLS, SMTPDeliveryUnknown, SMTPMailer
+
+MESSAGE = b"Subject: Sprint report\r\n\r\nHello\r\n.leading dot\r\n"
+
+
+class FakeSMTPServer:
+    """
+    Minimal SMTP server on localhost that records what the client sends.
+
+    When advertising PIPELINING it withholds the MAIL and RCPT replies until
+    DATA arrives, so a client that waits for each reply would stall.
+    """
+
+    def __init__(self, pipelining=True, refuse=(), drop_after_data=False, data_reply_delay=0.0):
+        self.pipelining = pipelining
+        self.refuse = set(refuse)
+        self.drop_after_data = drop_after_data
+        self.data_reply_delay = data_reply_delay
+        self.commands = []
+        self.messages = []
+
+        self._listener = socket.create_server(('127.0.0.1', 0))
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def close(self):
+        self._listener.close()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        with conn, conn.makefile('rb') as rfile:
+            conn.sendall(b'220 fake ESMTP\r\n')
+            pending = []
+            accepted = 0
+
+            for line in rfile:
+                command = line.decode('ascii').strip()
+                self.commands.append(command)
+                verb = command.split(':')[0].split(' ')[0].upper()
+
+                if verb == 'EHLO':
+                    extensions = ['250-fake', '250-SIZE 10000000']
+                    if self.pipelining:
+                        extensions.append('250-PIPELINING')
+                    extensions.append('250 8BITMIME')
+                    conn.sendall(('\r\n'.join(extensions) + '\r\n').encode('ascii'))
+                elif verb == 'MAIL':
+                    accepted = 0
+                    pending.append(b'250 sender ok\r\n')
+                elif verb == 'RCPT':
+                    if any(address in command for address in self.refuse):
+                        pending.append(b'550 no such user\r\n')
+                    else:
+                        accepted += 1
+                        pending.append(b'250 recipient ok\r\n')
+                elif verb == 'DATA':
+                    if not accepted:
+                        conn.sendall(b''.join(pending) + b'554 no valid recipients\r\n')
+                        pending.clear()
+                        continue
+
+                    conn.sendall(b''.join(pending) + b'354 go ahead\r\n')
+                    pending.clear()
+                    self.messages.append(self._read_body(rfile))
+
+                    if self.drop_after_data:
+                        return
+                    time.sleep(self.data_reply_delay)
+                    conn.sendall(b'250 queued\r\n')
+                elif verb == 'QUIT':
+                    conn.sendall(b'221 bye\r\n')
+                    return
+                else:
+                    conn.sendall(b'250 ok\r\n')
+
+                # Without PIPELINING every command is answered straight away
+                if pending and not self.pipelining:
+                    conn.sendall(b''.join(pending))
+                    pending.clear()
+
+    @staticmethod
+    def _read_body(rfile) -> bytes:
+        lines = []
+        for line in rfile:
+            if line == b'.\r\n':
+                break
+            lines.append(line)
+        return b''.join(lines)
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def factory(**kwargs):
+        server = FakeSMTPServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield factory
+    for server in servers:
+        server.close()
+
+
+def connect(server, timeout=5):
+    return PipeliningSMTPStartTLS('127.0.0.1', server.port, timeout=timeout)
+
+
+def test_pipelined_partial_refusal(make_server):
+    """Refused recipients are reported while the rest still get the message."""
+    server = make_server(refuse={'bob@example.com'})
+    client = connect(server)
+
+    refused = client.sendmail('me@example.com', ['amy@example.com', 'bob@example.com'], MESSAGE)
+    client.quit()
+
+    assert list(refused) == ['bob@example.com']
+    assert refused['bob@example.com'][0] == 550
+    assert server.messages == [MESSAGE.replace(b'\r\n.leading', b'\r\n..leading')]
+    envelope = [command.split(':')[0] for command in server.commands[1:5]]
+    assert envelope == ['MAIL FROM', 'RCPT TO', 'RCPT TO', 'DATA']
+
+
+def test_pipelined_total_refusal(make_server):
+    """No message is sent when every recipient is refused."""
+    server = make_server(refuse={'amy@example.com', 'bob@example.com'})
+    client = connect(server)
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused) as excinfo:
+        client.sendmail('me@example.com', ['amy@example.com', 'bob@example.com'], MESSAGE)
+    client.quit()
+
+    assert set(excinfo.value.recipients) == {'amy@example.com', 'bob@example.com'}
+    assert server.messages == []
+    assert 'rset' in [command.lower() for command in server.commands]
+
+
+def test_server_without_pipelining(make_server):
+    """Servers that don't advertise PIPELINING get the standard exchange."""
+    server = make_server(pipelining=False, refuse={'bob@example.com'})
+    client = connect(server)
+
+    refused = client.sendmail('me@example.com', ['amy@example.com', 'bob@example.com'], MESSAGE)
+    client.quit()
+
+    assert list(refused) == ['bob@example.com']
+    assert len(server.messages) == 1
+
+
+@pytest.mark.parametrize('pipelining', [True, False])
+def test_disconnect_after_data(make_server, pipelining):
+    """A connection lost after the final "." is reported, not treated as a plain disconnect."""
+    server = make_server(pipelining=pipelining, drop_after_data=True)
+    client = connect(server)
+
+    with pytest.raises(SMTPDeliveryUnknown):
+        client.sendmail('me@example.com', ['amy@example.com'], MESSAGE)
+
+    assert len(server.messages) == 1
+
+
+def test_data_reply_outlasts_socket_timeout(make_server, monkeypatch):
+    """A slow reply to DATA (e.g. a scanning relay) is awaited past the normal timeout."""
+    monkeypatch.setattr(PipeliningSMTPStartTLS, 'DATA_REPLY_TIMEOUT', 5)
+    server = make_server(data_reply_delay=1.0)
+    client = connect(server, timeout=0.3)
+
+    refused = client.sendmail('me@example.com', ['amy@example.com'], MESSAGE)
+
+    assert refused == {}
+    assert client.sock.gettimeout() == 0.3
+    client.quit()
+
+
+def test_mailer_does_not_resend_after_data(make_server, monkeypatch):
+    """SMTPMailer retries disconnects, but never once the message data was sent."""
+    server = make_server(drop_after_data=True)
+    mailer = SMTPMailer(config=None)
+
+    def plain_connect():
+        mailer.server = connect(server)
+        mailer._messages_sent = 0
+        mailer._connected_at = time.monotonic()
+
+    monkeypatch.setattr(mailer, 'connect', plain_connect)
+    monkeypatch.setattr(smtp_mailer.time, 'sleep', lambda seconds: None)
+
+    with pytest.raises(SMTPDeliveryUnknown):
+        mailer.sendmail('me@example.com', ['amy@example.com'], MESSAGE)
+
+    assert len(server.messages) == 1
+
+
+@pytest.mark.parametrize('error, transient', [
+    (smtplib.SMTPServerDisconnected(), True),
+    (socket.gaierror(socket.EAI_AGAIN, 'Temporary failure in name resolution'), True),
+    (smtplib.SMTPResponseException(451, b'try later'), True),
+    (smtplib.SMTPResponseException(550, b'rejected'), False),
+    (smtplib.SMTPAuthenticationError(535, b'bad credentials'), False),
+    (SMTPDeliveryUnknown('lost'), False),
+])
+def test_is_transient(error, transient):
+    assert SMTPMailer._is_transient(error) is transient